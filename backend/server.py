@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -6,9 +6,11 @@ import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+
+import static_responses
 
 
 ROOT_DIR = Path(__file__).parent
@@ -52,6 +54,41 @@ async def get_status_checks():
     status_checks = await db.status_checks.find().to_list(1000)
     return [StatusCheck(**status_check) for status_check in status_checks]
 
+# FAQ, help and quiz content is precompiled at startup; see static_responses.py
+@api_router.get("/support/faq")
+async def get_faq(request: Request, category: Optional[str] = None, search: Optional[str] = None, limit: Optional[str] = None):
+    return static_responses.serve(request, static_responses.faq_response(category, search, limit))
+
+@api_router.get("/support/help")
+async def get_help(request: Request, topic: Optional[str] = None):
+    return static_responses.serve(request, static_responses.help_response(topic))
+
+# Status is stamped per request, so it is not precompiled
+@api_router.get("/support/status")
+async def get_system_status():
+    services = {
+        "api": "operational",
+        "database": "operational",
+        "ai_service": "operational",
+        "chat": "operational",
+        "analytics": "operational",
+    }
+    all_operational = all(value == "operational" for value in services.values())
+    services["last_updated"] = datetime.now(timezone.utc)
+    return {
+        "success": True,
+        "data": {
+            "overall_status": "operational" if all_operational else "partial_outage",
+            "services": services,
+            "uptime": "99.9%",
+            "response_time": "< 200ms"
+        }
+    }
+
+@api_router.get("/quiz/questions")
+async def get_quiz_questions(request: Request):
+    return static_responses.serve(request, static_responses.quiz_questions_response())
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -70,6 +107,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def precompile_static_responses():
+    static_responses.warm()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
@@ -0,0 +1,494 @@
+"""
+Static payloads served by the FastAPI service, precompiled once at startup.
+
+FAQ, help and quiz questions never change while the process is running, so
+every known filter combination is JSON-encoded, gzip/brotli-compressed and
+hashed into a strong ETag exactly once by warm(). Requests then only negotiate
+an encoding and either return the stored bytes or a bodiless 304. Free-text
+FAQ searches and unknown categories cannot be enumerated, so they are encoded
+on demand with cheap compression settings instead.
+"""
+
+import gzip
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip and identity are always served
+    brotli = None
+
+
+CONTENT_CACHE_CONTROL = "public, max-age=300"
+
+# (gzip level, brotli quality): maximum effort for payloads built once at
+# startup, cheap settings for ones built on the request path
+STARTUP_COMPRESSION = (9, 11)
+ON_DEMAND_COMPRESSION = (5, 4)
+
+# FAQ data
+FAQ_DATA = [
+    {
+        "id": 1,
+        "question": "O que é um Gêmeo IA?",
+        "answer": "Seu Gêmeo IA é um modelo de inteligência artificial personalizado que aprende especificamente sobre você - seus valores, padrões de pensamento, objetivos e experiências. Ao contrário de assistentes de IA genéricos, seu Gêmeo IA se torna unicamente seu, fornecendo insights e orientação adaptados à sua personalidade e necessidades específicas.",
+        "category": "produto"
+    },
+    {
+        "id": 2,
+        "question": "Meu Gêmeo IA pode substituir a terapia?",
+        "answer": "Não, o YOU não substitui a terapia profissional ou o aconselhamento de saúde mental. É uma ferramenta complementar projetada para apoiar seu crescimento pessoal e autoconsciência. Se você estiver lidando com problemas sérios de saúde mental, recomendamos procurar ajuda de um profissional qualificado.",
+        "category": "saude"
+    },
+    {
+        "id": 3,
+        "question": "Como meu Gêmeo IA personaliza sua orientação?",
+        "answer": "Seu Gêmeo IA aprende através de suas conversas, respostas ao questionário inicial e interações contínuas. Ele identifica seus padrões únicos, valores e objetivos para fornecer insights personalizados que se tornam mais precisos ao longo do tempo.",
+        "category": "produto"
+    },
+    {
+        "id": 4,
+        "question": "Posso usar meu Gêmeo IA se já estiver fazendo terapia?",
+        "answer": "Absolutamente! O YOU pode complementar sua terapia existente fornecendo suporte contínuo entre as sessões. Muitos usuários acham útil ter acesso 24/7 a insights personalizados e um espaço seguro para refletir.",
+        "category": "saude"
+    },
+    {
+        "id": 5,
+        "question": "Meus dados estão seguros?",
+        "answer": "Sim, levamos a privacidade muito a sério. Todas as suas conversas são criptografadas e seus dados nunca são compartilhados com terceiros. Você tem controle total sobre suas informações pessoais.",
+        "category": "privacidade"
+    },
+    {
+        "id": 6,
+        "question": "Quanto custa o YOU?",
+        "answer": "Oferecemos uma primeira sessão gratuita para você experimentar. Nossos planos pagos começam em R$ 29,90/mês para o plano Básico, com opções Premium e Enterprise disponíveis com recursos adicionais.",
+        "category": "preco"
+    },
+    {
+        "id": 7,
+        "question": "Como faço para cancelar minha assinatura?",
+        "answer": "Você pode cancelar sua assinatura a qualquer momento através das configurações da sua conta ou entrando em contato com nosso suporte. Não há taxas de cancelamento e você manterá acesso aos recursos premium até o final do período de cobrança atual.",
+        "category": "conta"
+    },
+    {
+        "id": 8,
+        "question": "O que acontece com meus dados se eu cancelar?",
+        "answer": "Seus dados permanecerão seguros e você poderá exportá-los a qualquer momento. Se desejar deletar permanentemente sua conta e todos os dados, você pode fazer isso nas configurações da conta.",
+        "category": "conta"
+    },
+    {
+        "id": 9,
+        "question": "O YOU funciona em dispositivos móveis?",
+        "answer": "Sim! O YOU é totalmente responsivo e funciona perfeitamente em smartphones, tablets e computadores. Você pode acessar seu Gêmeo IA a qualquer hora, em qualquer lugar.",
+        "category": "tecnico"
+    },
+    {
+        "id": 10,
+        "question": "Como posso melhorar as respostas do meu Gêmeo IA?",
+        "answer": "Quanto mais você conversa e compartilha sobre si mesmo, melhor seu Gêmeo IA te entende. Seja honesto sobre seus sentimentos, forneça feedback sobre as respostas e refaça o questionário periodicamente para manter seu perfil atualizado.",
+        "category": "produto"
+    }
+]
+
+# Contextual help topics
+HELP_TOPICS = {
+    "getting-started": {
+        "title": "Primeiros Passos",
+        "content": [
+            "Faça o questionário de personalidade para configurar seu Gêmeo IA",
+            "Comece uma conversa sobre algo que está em sua mente",
+            "Defina seus primeiros objetivos pessoais",
+            "Explore os diferentes tipos de apoio disponíveis"
+        ],
+        "related_links": [
+            {
+                "title": "Fazer Quiz",
+                "url": "/quiz"
+            },
+            {
+                "title": "Ver Preços",
+                "url": "/precos"
+            }
+        ]
+    },
+    "chat": {
+        "title": "Como Conversar com seu Gêmeo IA",
+        "content": [
+            "Seja honesto sobre seus sentimentos e pensamentos",
+            "Compartilhe contexto sobre situações específicas",
+            "Faça perguntas abertas para reflexão",
+            "Avalie as respostas para melhorar a personalização"
+        ],
+        "related_links": [
+            {
+                "title": "Iniciar Conversa",
+                "url": "/conversa"
+            }
+        ]
+    },
+    "goals": {
+        "title": "Gerenciamento de Objetivos",
+        "content": [
+            "Defina objetivos específicos e mensuráveis",
+            "Estabeleça prazos realistas",
+            "Acompanhe seu progresso regularmente",
+            "Use os insights da IA para ajustes"
+        ],
+        "related_links": [
+            {
+                "title": "Meus Objetivos",
+                "url": "/objetivos"
+            }
+        ]
+    },
+    "privacy": {
+        "title": "Privacidade e Segurança",
+        "content": [
+            "Todas as conversas são criptografadas",
+            "Seus dados nunca são compartilhados",
+            "Você pode exportar ou deletar seus dados",
+            "Controle total sobre configurações de privacidade"
+        ],
+        "related_links": [
+            {
+                "title": "Configurações",
+                "url": "/configuracoes"
+            }
+        ]
+    }
+}
+
+# Quiz questions data
+QUIZ_QUESTIONS = [
+    {
+        "id": 1,
+        "question": "Como você se sente quando está sozinho(a)?",
+        "type": "scale",
+        "options": [
+            {
+                "value": 1,
+                "label": "Muito desconfortável"
+            },
+            {
+                "value": 2,
+                "label": "Desconfortável"
+            },
+            {
+                "value": 3,
+                "label": "Neutro"
+            },
+            {
+                "value": 4,
+                "label": "Confortável"
+            },
+            {
+                "value": 5,
+                "label": "Muito confortável"
+            }
+        ]
+    },
+    {
+        "id": 2,
+        "question": "O que mais te preocupa atualmente?",
+        "type": "multiple",
+        "options": [
+            {
+                "value": "relacionamentos",
+                "label": "Relacionamentos"
+            },
+            {
+                "value": "carreira",
+                "label": "Carreira"
+            },
+            {
+                "value": "saude",
+                "label": "Saúde"
+            },
+            {
+                "value": "financas",
+                "label": "Finanças"
+            },
+            {
+                "value": "autoestima",
+                "label": "Autoestima"
+            }
+        ]
+    },
+    {
+        "id": 3,
+        "question": "Como você lidaria com uma decisão difícil no trabalho?",
+        "type": "text",
+        "placeholder": "Descreva seu processo de tomada de decisão..."
+    },
+    {
+        "id": 4,
+        "question": "Quais são seus principais objetivos de vida?",
+        "type": "multiple",
+        "options": [
+            {
+                "value": "crescimento_pessoal",
+                "label": "Crescimento pessoal"
+            },
+            {
+                "value": "sucesso_profissional",
+                "label": "Sucesso profissional"
+            },
+            {
+                "value": "relacionamentos_saudaveis",
+                "label": "Relacionamentos saudáveis"
+            },
+            {
+                "value": "saude_mental",
+                "label": "Saúde mental"
+            },
+            {
+                "value": "estabilidade_financeira",
+                "label": "Estabilidade financeira"
+            }
+        ]
+    },
+    {
+        "id": 5,
+        "question": "Como você reage ao estresse?",
+        "type": "single",
+        "options": [
+            {
+                "value": "isolamento",
+                "label": "Me isolo das outras pessoas"
+            },
+            {
+                "value": "busco_ajuda",
+                "label": "Busco ajuda de amigos ou familiares"
+            },
+            {
+                "value": "exercicios",
+                "label": "Faço exercícios ou atividades físicas"
+            },
+            {
+                "value": "procrastino",
+                "label": "Procrastino ou evito o problema"
+            },
+            {
+                "value": "enfrento",
+                "label": "Enfrento o problema diretamente"
+            }
+        ]
+    }
+]
+
+FAQ_CATEGORIES = list(dict.fromkeys(item["category"] for item in FAQ_DATA))
+
+# (category, limit) -> PrecompiledResponse for every search-less FAQ query,
+# filled by warm() and never evicted
+_precompiled_faq = {}
+
+
+@dataclass(frozen=True)
+class PrecompiledResponse:
+    """One JSON payload with its compressed variants and per-variant ETags."""
+
+    body: bytes
+    cache_control: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+    etags: Dict[str, str] = field(default_factory=dict)
+
+
+def _encode_json(payload):
+    """Encode `payload` the way Express' res.json does."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def precompile(payload, cache_control=CONTENT_CACHE_CONTROL, compression=STARTUP_COMPRESSION):
+    """Encode `payload` and compress it once."""
+    return _precompile_body(_encode_json(payload), cache_control, compression)
+
+
+def _precompile_body(body, cache_control=CONTENT_CACHE_CONTROL, compression=STARTUP_COMPRESSION):
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    gzip_level, brotli_quality = compression
+
+    encoded = {"identity": body}
+    gzipped = gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if len(gzipped) < len(body):
+        encoded["gzip"] = gzipped
+    if brotli is not None:
+        compressed = brotli.compress(body, mode=brotli.MODE_TEXT, quality=brotli_quality)
+        if len(compressed) < len(body):
+            encoded["br"] = compressed
+
+    # Strong ETags must differ per content-coding, so suffix the compressed ones
+    etags = {
+        coding: f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"'
+        for coding in encoded
+    }
+    return PrecompiledResponse(body=body, cache_control=cache_control, encoded=encoded, etags=etags)
+
+
+def _parse_accept_encoding(header):
+    """Split an Accept-Encoding header into (accepted, refused) codings by q-value."""
+    accepted, refused = set(), set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        coding = coding.strip().lower()
+        if coding:
+            (accepted if quality > 0 else refused).add(coding)
+    return accepted, refused
+
+
+def _negotiate(request, precompiled):
+    accepted, refused = _parse_accept_encoding(request.headers.get("accept-encoding", ""))
+    for coding in ("br", "gzip"):
+        if coding not in precompiled.encoded or coding in refused:
+            continue
+        if coding in accepted or "*" in accepted:
+            return coding
+    return "identity"
+
+
+def _not_modified(request, etag):
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison against the selected representation
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags
+
+
+def serve(request: Request, precompiled: PrecompiledResponse) -> Response:
+    """Answer `request` from a precompiled payload, honouring If-None-Match."""
+    coding = _negotiate(request, precompiled)
+    headers = {
+        "ETag": precompiled.etags[coding],
+        "Cache-Control": precompiled.cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    return Response(
+        content=precompiled.encoded[coding],
+        media_type="application/json; charset=utf-8",
+        headers=headers,
+    )
+
+
+def _parse_limit(value):
+    """Mirror JavaScript's parseInt: leading integer or None."""
+    if value is None:
+        return None
+    match = re.match(r"\s*([+-]?\d+)", value)
+    return int(match.group(1)) if match else None
+
+
+def _faq_payload(category, search, limit):
+    items = FAQ_DATA
+    if category:
+        items = [item for item in items if item["category"] == category]
+    if search:
+        term = search.lower()
+        items = [
+            item for item in items
+            if term in item["question"].lower() or term in item["answer"].lower()
+        ]
+    if limit is not None:
+        items = items[:limit]
+
+    return {
+        "success": True,
+        "data": {
+            "faq": items,
+            "categories": FAQ_CATEGORIES,
+            "total": len(items),
+            "filters": {
+                "category": category or None,
+                "search": search or None
+            }
+        }
+    }
+
+
+@lru_cache(maxsize=128)
+def _on_demand_faq(category, search, limit):
+    return precompile(_faq_payload(category, search, limit), compression=ON_DEMAND_COMPRESSION)
+
+
+def _normalize_limit(limit):
+    # Limits past either end of the list select the same slice, which keeps
+    # the precompiled key space finite
+    parsed = _parse_limit(limit)
+    if parsed is None:
+        return None
+    total = len(FAQ_DATA)
+    return None if parsed >= total else max(parsed, -total)
+
+
+def faq_response(category=None, search=None, limit=None):
+    """GET /api/support/faq payload, precompiled unless the query is ad hoc."""
+    category, search, limit = category or None, search or None, _normalize_limit(limit)
+    if search is None:
+        precompiled = _precompiled_faq.get((category, limit))
+        if precompiled is not None:
+            return precompiled
+    return _on_demand_faq(category, search, limit)
+
+
+@lru_cache(maxsize=None)
+def _help_variant(topic):
+    if topic is not None:
+        return precompile({"success": True, "data": {"topic": HELP_TOPICS[topic]}})
+
+    return precompile({
+        "success": True,
+        "data": {
+            "topics": [
+                {"id": key, "title": value["title"]}
+                for key, value in HELP_TOPICS.items()
+            ],
+            "featured": HELP_TOPICS["getting-started"]
+        }
+    })
+
+
+def help_response(topic=None):
+    """Precompiled GET /api/support/help payload; unknown topics get the index."""
+    return _help_variant(topic if topic in HELP_TOPICS else None)
+
+
+@lru_cache(maxsize=None)
+def quiz_questions_response():
+    """Precompiled GET /api/quiz/questions payload."""
+    return precompile({"success": True, "data": {"questions": QUIZ_QUESTIONS}})
+
+
+def warm():
+    """Build every known filter combination so no request pays the first encode."""
+    # Many (category, limit) keys yield the same body, so each distinct body
+    # is compressed once and shared between its keys
+    by_body = {}
+    total = len(FAQ_DATA)
+    for category in [None, *FAQ_CATEGORIES]:
+        for limit in [None, *range(-total, total)]:
+            body = _encode_json(_faq_payload(category, None, limit))
+            if body not in by_body:
+                by_body[body] = _precompile_body(body)
+            _precompiled_faq[(category, limit)] = by_body[body]
+    for topic in [None, *HELP_TOPICS]:
+        help_response(topic)
+    quiz_questions_response()
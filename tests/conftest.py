@@ -0,0 +1,126 @@
+"""
+Shared fixtures for driving backend/server.py in-process.
+
+The FastAPI app is imported directly and its MongoDB handle is swapped for an
+in-memory stand-in, so the suite needs neither a running database nor the
+remote preview deployment used by backend_test.py.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# server.py reads these at import time; the Motor client it builds is lazy and
+# never connects because `server.db` is replaced before any request is made.
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark_db")
+
+import server  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pytest_benchmark.utils import get_machine_id, parse_compare_fail  # noqa: E402
+
+BENCHMARK_STORAGE = Path(__file__).resolve().parent / ".benchmarks"
+DEFAULT_COMPARE_FAIL = "median:25%"
+
+
+def pytest_addoption(parser):
+    parser.getgroup("benchmark").addoption(
+        "--benchmark-baseline",
+        metavar="NAME",
+        help=(
+            "Compare against the latest run saved with --benchmark-save=NAME in "
+            f"tests/.benchmarks and fail on regressions (default {DEFAULT_COMPARE_FAIL})."
+        ),
+    )
+
+
+def pytest_configure(config):
+    # Runs before pytest-benchmark builds its session, so the options below
+    # are picked up as if they had been passed on the command line
+    if config.getoption("benchmark_storage") == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BENCHMARK_STORAGE}"
+
+    name = config.getoption("benchmark_baseline")
+    if not name:
+        return
+
+    machine_id = get_machine_id()
+    baselines = sorted(BENCHMARK_STORAGE.glob(f"{machine_id}/[0-9][0-9][0-9][0-9]_{name}.json"))
+    if not baselines:
+        raise pytest.UsageError(
+            f"No benchmark baseline named {name!r} for {machine_id} in {BENCHMARK_STORAGE}. "
+            f"Record one first with: pytest tests/ --benchmark-only --benchmark-save={name}"
+        )
+
+    config.option.benchmark_compare = str(baselines[-1])
+    if not config.getoption("benchmark_compare_fail"):
+        config.option.benchmark_compare_fail = [parse_compare_fail(DEFAULT_COMPARE_FAIL)]
+
+
+class InMemoryCursor:
+    """Mimics the slice of Motor's cursor API that server.py uses."""
+
+    def __init__(self, documents):
+        self._documents = documents
+
+    async def to_list(self, length):
+        return [dict(document) for document in self._documents[:length]]
+
+
+class InMemoryCollection:
+    """Stores documents in a plain list, mirroring Motor's insert/find calls."""
+
+    def __init__(self):
+        self.documents = []
+
+    async def insert_one(self, document):
+        # Motor adds the generated ObjectId to the caller's dict in place
+        document.setdefault("_id", len(self.documents) + 1)
+        self.documents.append(dict(document))
+        return document["_id"]
+
+    def find(self, *args, **kwargs):
+        return InMemoryCursor(self.documents)
+
+
+class InMemoryDatabase:
+    """Hands out one InMemoryCollection per attribute name, like a Motor db."""
+
+    def __init__(self):
+        self._collections = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._collections.setdefault(name, InMemoryCollection())
+
+
+@pytest.fixture
+def status_documents():
+    """Factory building `count` status_checks documents as the POST handler stores them."""
+
+    def build(count):
+        return [
+            {**server.StatusCheck(client_name=f"client-{index}").dict(), "_id": index}
+            for index in range(count)
+        ]
+
+    return build
+
+
+@pytest.fixture
+def memory_db(monkeypatch):
+    database = InMemoryDatabase()
+    monkeypatch.setattr(server, "db", database)
+    return database
+
+
+@pytest.fixture
+def client(memory_db):
+    with TestClient(server.app) as test_client:
+        yield test_client
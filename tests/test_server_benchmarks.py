@@ -0,0 +1,157 @@
+"""
+Microbenchmarks for the FastAPI hot paths in backend/server.py.
+
+Requests go through Starlette's TestClient against the in-memory data layer
+from conftest.py, so timings cover routing, validation, serialization and
+middleware without network or MongoDB noise.
+
+Runs are stored as JSON under tests/.benchmarks/<machine id>/. Record a named
+baseline on the machine that will run the comparison:
+
+    pytest tests/ --benchmark-only --benchmark-save=baseline
+
+Compare against the latest run with that name, failing when a benchmark's
+median is more than 25% slower (override with --benchmark-compare-fail):
+
+    pytest tests/ --benchmark-only --benchmark-baseline=baseline
+"""
+
+import importlib
+import sys
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+import server
+import static_responses
+
+COLLECTION_SIZES = [0, 10, 100, 1000]
+ALLOWED_ORIGIN = "http://localhost:3000"
+
+
+@pytest.mark.benchmark(group="status-post")
+def test_create_status_check(benchmark, client):
+    # The handler never reads the collection and an insert does not depend on
+    # its size, so unlike GET there is no collection-size axis here
+    response = benchmark(client.post, "/api/status", json={"client_name": "bench"})
+
+    assert response.status_code == 200
+    assert response.json()["client_name"] == "bench"
+
+
+@pytest.mark.benchmark(group="status-get")
+@pytest.mark.parametrize("size", COLLECTION_SIZES)
+def test_get_status_checks(benchmark, client, memory_db, status_documents, size):
+    memory_db.status_checks.documents = status_documents(size)
+
+    response = benchmark(client.get, "/api/status")
+
+    assert response.status_code == 200
+    assert len(response.json()) == size
+
+
+@pytest.mark.benchmark(group="serialization")
+@pytest.mark.parametrize("size", COLLECTION_SIZES)
+def test_status_check_serialization(benchmark, status_documents, size):
+    documents = status_documents(size)
+
+    def serialize():
+        return jsonable_encoder([server.StatusCheck(**document) for document in documents])
+
+    payload = benchmark(serialize)
+
+    assert len(payload) == size
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_cors_preflight(benchmark, client):
+    headers = {
+        "Origin": ALLOWED_ORIGIN,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type",
+    }
+
+    response = benchmark(client.options, "/api/status", headers=headers)
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" in response.headers
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_cors_simple_request(benchmark, client):
+    response = benchmark(client.get, "/api/", headers={"Origin": ALLOWED_ORIGIN})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" in response.headers
+
+
+@pytest.mark.benchmark(group="startup")
+def test_server_import(benchmark):
+    original = sys.modules["server"]
+
+    def drop_server_module():
+        sys.modules.pop("server", None)
+
+    def close_mongo_client(name):
+        sys.modules["server"].client.close()
+
+    try:
+        module = benchmark.pedantic(
+            importlib.import_module,
+            args=("server",),
+            setup=drop_server_module,
+            teardown=close_mongo_client,
+            rounds=10,
+        )
+    finally:
+        sys.modules["server"] = original
+
+    assert module.app is not original.app
+
+
+@pytest.mark.benchmark(group="startup")
+def test_app_startup_shutdown(benchmark, memory_db):
+    def start_and_stop():
+        with TestClient(server.app):
+            pass
+
+    benchmark(start_and_stop)
+
+
+@pytest.mark.benchmark(group="startup")
+def test_static_responses_warm(benchmark):
+    def clear_precompiled():
+        static_responses._precompiled_faq.clear()
+        static_responses._help_variant.cache_clear()
+        static_responses.quiz_questions_response.cache_clear()
+
+    benchmark.pedantic(static_responses.warm, setup=clear_precompiled, rounds=5)
+
+    categories = len(static_responses.FAQ_CATEGORIES) + 1
+    limits = 2 * len(static_responses.FAQ_DATA) + 1
+    assert len(static_responses._precompiled_faq) == categories * limits
+
+
+@pytest.mark.benchmark(group="static")
+@pytest.mark.parametrize("path", [
+    "/api/support/faq",
+    "/api/support/faq?category=conta&limit=1",
+    "/api/support/help?topic=chat",
+    "/api/support/status",
+    "/api/quiz/questions",
+])
+def test_static_response(benchmark, client, path):
+    response = benchmark(client.get, path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+
+@pytest.mark.benchmark(group="static")
+def test_static_response_not_modified(benchmark, client):
+    etag = client.get("/api/support/faq").headers["etag"]
+
+    response = benchmark(client.get, "/api/support/faq", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
@@ -0,0 +1,102 @@
+"""
+Behaviour of the precompiled static endpoints served from static_responses.py.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import static_responses
+
+
+def test_faq_filters_match_express_route(client):
+    response = client.get("/api/support/faq", params={"category": "conta", "limit": "1"})
+
+    data = response.json()["data"]
+    assert [item["id"] for item in data["faq"]] == [7]
+    assert data["total"] == 1
+    assert data["filters"] == {"category": "conta", "search": None}
+    assert data["categories"] == static_responses.FAQ_CATEGORIES
+
+
+def test_faq_search_is_case_insensitive(client):
+    data = client.get("/api/support/faq", params={"search": "DADOS"}).json()["data"]
+
+    assert data["total"] == 2
+    assert data["filters"]["search"] == "DADOS"
+
+
+def test_unknown_help_topic_returns_index(client):
+    unknown = client.get("/api/support/help", params={"topic": "nope"})
+    index = client.get("/api/support/help")
+
+    assert unknown.content == index.content
+    assert unknown.headers["etag"] == index.headers["etag"]
+
+
+@pytest.mark.parametrize("coding", ["gzip", "br"])
+def test_compressed_variant_is_served(client, coding):
+    if coding == "br" and static_responses.brotli is None:
+        pytest.skip("brotli not installed")
+
+    response = client.get("/api/quiz/questions", headers={"Accept-Encoding": coding})
+
+    assert response.headers["content-encoding"] == coding
+    assert response.headers["etag"].endswith(f'-{coding}"')
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(response.json()["data"]["questions"]) == 5
+
+
+def test_refused_coding_is_not_served_via_wildcard(client):
+    response = client.get("/api/quiz/questions", headers={"Accept-Encoding": "br;q=0, *"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+
+
+def test_if_none_match_returns_304(client):
+    first = client.get("/api/support/faq", headers={"Accept-Encoding": "gzip"})
+
+    response = client.get(
+        "/api/support/faq",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f'W/{first.headers["etag"]}'},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == first.headers["etag"]
+    assert response.headers["cache-control"] == static_responses.CONTENT_CACHE_CONTROL
+
+
+def test_if_none_match_only_matches_selected_coding(client):
+    gzipped = client.get("/api/support/faq", headers={"Accept-Encoding": "gzip"})
+
+    response = client.get(
+        "/api/support/faq",
+        headers={"Accept-Encoding": "identity", "If-None-Match": gzipped.headers["etag"]},
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] != gzipped.headers["etag"]
+
+
+def test_status_is_stamped_per_request(client):
+    response = client.get("/api/support/status")
+
+    assert "etag" not in response.headers
+    assert response.json()["data"]["overall_status"] == "operational"
+    assert datetime.fromisoformat(response.json()["data"]["services"]["last_updated"]).utcoffset() == timedelta(0)
+    assert response.json()["data"]["services"]["last_updated"] != (
+        client.get("/api/support/status").json()["data"]["services"]["last_updated"]
+    )
+
+
+def test_ad_hoc_searches_do_not_evict_warmed_variants(client):
+    warmed = static_responses.faq_response("conta", limit="1")
+
+    for index in range(600):
+        static_responses.faq_response(search=f"termo-{index}")
+
+    assert static_responses.faq_response("conta", limit="1") is warmed
+    assert static_responses.faq_response(limit="50") is static_responses.faq_response()